@@ -9,12 +9,11 @@ import logging
 from typing import Optional
 from fake_useragent import UserAgent
 import asyncio
-from http import HTTPStatus
 
 from src.scraper.base import BaseScraper, ScrapedContent
 from src.content.cleaner import clean_html_content
 from src.utils.url import is_valid_url, is_likely_download_url
-from src.utils.constants import JS_REQUIRED_INDICATORS
+from src.utils.constants import js_required_scan
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +28,11 @@ class AiohttpScraper(BaseScraper):
         super().__init__()
         self.resource_cost = 2.0  # Medium resource cost
         self.user_agent = UserAgent()
+        self._base_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'DNT': '1',
+        }
         self.session: Optional[aiohttp.ClientSession] = None
         self.timeout = aiohttp.ClientTimeout(total=15)
         self.max_retries = 3
@@ -41,34 +45,11 @@ class AiohttpScraper(BaseScraper):
 
     async def is_suitable(self, url: str) -> bool:
         """Check if this scraper is suitable for the URL."""
-        if not await is_valid_url(url) or await is_likely_download_url(url):
-            return False
-            
-        # Try a HEAD request
-        try:
-            await self._ensure_session()
-            headers = {'User-Agent': self.user_agent.random}
-            
-            async with self.session.head(
-                url, 
-                headers=headers, 
-                allow_redirects=True,
-                ssl=False
-            ) as response:
-                # Check status code
-                if response.status != HTTPStatus.OK:
-                    return False
-                    
-                # Check content type
-                content_type = response.headers.get('content-type', '').lower()
-                if not 'text/html' in content_type:
-                    return False
-                    
-                return True
-                
-        except Exception as e:
-            logger.debug(f"URL not suitable for aiohttp: {e}")
+        # URL-shape checks only; the GET in scrape() filters non-HTML
+        # responses, so a HEAD preflight would just double connection cost.
+        if not is_valid_url(url) or is_likely_download_url(url):
             return False
+        return True
 
     async def scrape(self, url: str) -> ScrapedContent:
         """Scrape content using aiohttp."""
@@ -78,13 +59,8 @@ class AiohttpScraper(BaseScraper):
         
         while retries <= self.max_retries:
             try:
-                headers = {
-                    'User-Agent': self.user_agent.random,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'DNT': '1',
-                }
-                
+                headers = dict(self._base_headers, **{'User-Agent': self._next_ua()})
+
                 async with self.session.get(url, headers=headers, ssl=False) as response:
                     if response.status != 200:
                         return ScrapedContent(
@@ -94,7 +70,18 @@ class AiohttpScraper(BaseScraper):
                             status="error",
                             error=f"HTTP {response.status}"
                         )
-                    
+
+                    # Filter non-HTML responses (previously done via HEAD preflight)
+                    content_type = response.headers.get('content-type', '').lower()
+                    if 'text/html' not in content_type:
+                        return ScrapedContent(
+                            url=url,
+                            content="",
+                            title="",
+                            status="error",
+                            error="Non-HTML content"
+                        )
+
                     html_content = await response.text()
                     
                     try:
@@ -154,8 +141,7 @@ class AiohttpScraper(BaseScraper):
 
     def _requires_javascript(self, soup: BeautifulSoup) -> bool:
         """Check if page appears to require JavaScript."""
-        text = soup.get_text().lower()
-        return any(indicator in text for indicator in JS_REQUIRED_INDICATORS)
+        return js_required_scan(soup.get_text())
 
     async def cleanup(self) -> None:
         """Clean up resources."""
@@ -5,8 +5,29 @@ Base scraper class defining the interface for all scraper implementations.
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from typing import Optional, Dict, Any, Set
+import html
+import re
 from bs4 import BeautifulSoup
 
+# Title tags live in the document head, so searching the first 8KB with a
+# compiled regex is enough and avoids a full BS4 parse.
+_TITLE_RE = re.compile(r'<title[^>]*>([^<]{0,512})</title>', re.IGNORECASE)
+
+def fast_title(raw_html: str) -> str:
+    """
+    Extract the page title from raw HTML without a full parse.
+
+    Args:
+        raw_html: Raw HTML content
+
+    Returns:
+        str: Title text, or empty string if not found
+    """
+    match = _TITLE_RE.search(raw_html[:8192])
+    if match:
+        return html.unescape(match.group(1)).strip()
+    return ""
+
 @dataclass
 class ScrapedContent:
     """
@@ -36,7 +57,27 @@ class BaseScraper(ABC):
     def __init__(self):
         """Initialize base scraper."""
         self.resource_cost = 1.0  # Base resource cost, higher means more intensive
-        
+        self._ua_pool: list = []
+        self._ua_idx = 0
+
+    def _next_ua(self) -> str:
+        """
+        Get a user agent string from a pre-generated pool.
+
+        Generating a user agent via fake_useragent on every request is
+        expensive, so a pool of 64 is built lazily on first use and then
+        served round-robin. Requires subclasses to set `self.user_agent`.
+
+        Returns:
+            str: User agent string
+        """
+        if not self._ua_pool:
+            self._ua_pool = [self.user_agent.random for _ in range(64)]
+        ua = self._ua_pool[self._ua_idx]
+        self._ua_idx = (self._ua_idx + 1) & 63
+        return ua
+
+
     @abstractmethod
     async def scrape(self, url: str) -> ScrapedContent:
         """
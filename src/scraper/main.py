@@ -20,6 +20,10 @@ from src.utils.logging import get_logger
 
 logger = get_logger(__name__)
 
+# Batch gen-0 collections so the scrape loop doesn't pay a full-heap walk
+# per URL; cleanup paths only run gen-0 sweeps.
+gc.set_threshold(50_000, 10, 10)
+
 class ScraperOrchestrator:
     """
     Coordinates multiple scraper implementations and manages the scraping workflow.
@@ -134,7 +138,7 @@ class ScraperOrchestrator:
                 except Exception as e:
                     logger.error(f"Error processing URL {next_url.link}: {e}")
                 finally:
-                    gc.collect()
+                    gc.collect(0)
 
                 # Brief pause between URLs
                 await asyncio.sleep(1)
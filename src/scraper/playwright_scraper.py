@@ -5,7 +5,10 @@ Final tier scraper with full browser capabilities.
 
 import asyncio
 import logging
+import re
+from collections import OrderedDict
 from typing import Optional, Dict, Any
+from urllib.parse import urlparse
 from playwright.async_api import async_playwright, Browser, Page, Error as PlaywrightError
 from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 from fake_useragent import UserAgent
@@ -25,6 +28,70 @@ from src.utils.constants import (
 
 logger = logging.getLogger(__name__)
 
+def _patch_playwright_json() -> None:
+    """
+    Swap the Playwright transport's JSON codec for orjson.
+
+    Every protocol message (including multi-MB page.content() responses)
+    goes through json.loads/json.dumps in the transport. orjson decodes
+    the same payloads several times faster with far fewer transient
+    allocations. Must run before async_playwright().start(); silently
+    skipped when orjson or the private transport module is unavailable.
+    """
+    try:
+        import orjson
+        from playwright._impl import _transport
+
+        class _OrjsonCodec:
+            loads = staticmethod(orjson.loads)
+
+            @staticmethod
+            def dumps(obj, *args, **kwargs):
+                return orjson.dumps(obj).decode()
+
+        _transport.json = _OrjsonCodec()
+    except Exception as e:
+        logger.debug(f"Playwright orjson patch not applied: {e}")
+
+_patch_playwright_json()
+
+# Cloudflare challenge text probes; only these decide whether a detected
+# challenge has cleared, since markup markers (e.g. an embedded Turnstile
+# widget) can legitimately persist on the real page.
+_CF_TEXTS = (
+    "checking if the site connection is secure",
+    "please wait while we verify",
+    "please stand by, while we are checking"
+)
+_CF_TEXTS_RE = re.compile(
+    '|'.join(re.escape(s) for s in _CF_TEXTS),
+    re.IGNORECASE
+)
+
+# Challenge markup markers (formerly probed one selector at a time) plus the
+# text probes, folded into one union so detection is a single pass.
+_CF_UNION = re.compile(
+    '|'.join(re.escape(s) for s in (
+        'cf-browser-verification',
+        'challenge-form',
+        'cf-challenge',
+        'challenges.cloudflare.com',
+    ) + _CF_TEXTS),
+    re.IGNORECASE
+)
+
+# Probe all candidate content containers in a single JS evaluation rather
+# than one wait_for_selector round-trip per selector.
+_CONTENT_SELECTOR_JS = """() => {
+    const sels = ['main', 'article', '#main-content', '.main-content',
+                  '.content', '#content', '[role="main"]'];
+    for (const s of sels) {
+        const el = document.querySelector(s);
+        if (el && el.innerHTML.trim()) return el.outerHTML;
+    }
+    return '';
+}"""
+
 class PlaywrightScraper(BaseScraper):
     """
     Advanced scraper using Playwright for JavaScript-heavy websites.
@@ -39,13 +106,27 @@ class PlaywrightScraper(BaseScraper):
         self.playwright = None
         self.browser: Optional[Browser] = None
         self.page: Optional[Page] = None
+        self._cdp = None
         self.max_retries = 2
         self.retry_delay = 2
+        # Static context options, built once; the user agent is substituted
+        # per context creation.
+        self._context_opts: Dict[str, Any] = {
+            'viewport': {'width': 1280, 'height': 720},
+            'ignore_https_errors': True
+        }
+        # storage_state snapshots keyed by host so recrawls of the same
+        # origin start with a warm cookie jar; bounded LRU.
+        self._storage_states: "OrderedDict[str, dict]" = OrderedDict()
+        self._max_storage_states = 8
 
-    async def _ensure_browser(self) -> None:
+    async def _ensure_browser(self, host: Optional[str] = None) -> None:
         """
         Ensure browser is initialized and running.
-        
+
+        Args:
+            host: Host being scraped, used to reuse a saved storage state
+
         Raises:
             RuntimeError: If browser initialization fails
         """
@@ -65,13 +146,18 @@ class PlaywrightScraper(BaseScraper):
 
         if not self.page:
             try:
-                context = await self.browser.new_context(
-                    viewport={'width': 1280, 'height': 720},
-                    user_agent=self.user_agent.random,
-                    ignore_https_errors=True
-                )
+                options = dict(self._context_opts, user_agent=self._next_ua())
+                state = self._storage_states.get(host) if host else None
+                if state:
+                    options['storage_state'] = state
+                context = await self.browser.new_context(**options)
                 self.page = await context.new_page()
                 await self._configure_page()
+                try:
+                    self._cdp = await context.new_cdp_session(self.page)
+                except Exception as e:
+                    logger.debug(f"Could not open CDP session: {e}")
+                    self._cdp = None
             except Exception as e:
                 logger.error(f"Failed to create page: {e}")
                 raise RuntimeError(f"Page creation failed: {e}")
@@ -85,19 +171,47 @@ class PlaywrightScraper(BaseScraper):
         self.page.set_default_timeout(PAGE_LOAD_TIMEOUT)
         self.page.set_default_navigation_timeout(PAGE_LOAD_TIMEOUT)
 
-        # Set up error handling
-        self.page.on("pageerror", lambda err: logger.error(f"Page error: {err}"))
+        # Set up error handling. Each handler fires a Playwright IPC message
+        # per event — SPAs can emit hundreds of console logs per navigation —
+        # so only subscribe when the corresponding log level is enabled.
         self.page.on("crash", lambda: logger.error("Page crashed"))
-        self.page.on("console", lambda msg: logger.debug(f"Console {msg.type}: {msg.text}"))
+        if logger.isEnabledFor(logging.ERROR):
+            self.page.on("pageerror", lambda err: logger.error(f"Page error: {err}"))
+        if logger.isEnabledFor(logging.DEBUG):
+            self.page.on("console", lambda msg: logger.debug(f"Console {msg.type}: {msg.text}"))
 
         # Block unnecessary resources
         await self.page.route("**/*.{png,jpg,jpeg,gif,svg,css,woff,woff2,ttf}", 
             lambda route: route.abort())
 
+    async def _get_rendered_html(self) -> str:
+        """
+        Fetch the rendered page HTML.
+
+        Uses the cached CDP session with DOM.getOuterHTML when available,
+        which avoids the extra copy and per-message JSON decoding that
+        `page.content()` incurs on the Playwright channel. Falls back to
+        `page.content()` if the CDP path fails.
+
+        Returns:
+            str: Rendered HTML of the current page
+        """
+        if self._cdp:
+            try:
+                doc = await self._cdp.send("DOM.getDocument", {"depth": 0})
+                result = await self._cdp.send(
+                    "DOM.getOuterHTML",
+                    {"nodeId": doc["root"]["nodeId"]}
+                )
+                return result["outerHTML"]
+            except Exception as e:
+                logger.debug(f"CDP HTML fetch failed, falling back: {e}")
+        return await self.page.content()
+
     async def is_suitable(self, url: str) -> bool:
         """Check if this scraper is suitable for the URL."""
         # Playwright is our last resort, so accept most URLs
-        if not await is_valid_url(url) or await is_likely_download_url(url):
+        if not is_valid_url(url) or is_likely_download_url(url):
             return False
         return True
 
@@ -109,35 +223,25 @@ class PlaywrightScraper(BaseScraper):
             bool: True if successfully bypassed or no Cloudflare
         """
         try:
-            # Check for Cloudflare elements
-            cloudflare_selectors = [
-                "div[class*='cf-browser-verification']",
-                "#challenge-form",
-                "div[class*='cf-challenge']",
-                "iframe[src*='challenges.cloudflare.com']"
-            ]
-
-            for selector in cloudflare_selectors:
-                try:
-                    if await self.page.wait_for_selector(selector, timeout=5000):
-                        logger.info("Detected Cloudflare challenge")
-                        
-                        # Wait for challenge to process
-                        await self.page.wait_for_load_state("networkidle", timeout=30000)
-                        
-                        # Check if we're past Cloudflare
-                        content = await self.page.content()
-                        if not any(cf_text in content.lower() for cf_text in [
-                            "checking if the site connection is secure",
-                            "please wait while we verify",
-                            "please stand by, while we are checking"
-                        ]):
-                            return True
-                except PlaywrightTimeoutError:
-                    continue
+            # One scan of the rendered HTML replaces the per-selector waits
+            content = await self._get_rendered_html()
+            if not _CF_UNION.search(content):
+                return True  # No Cloudflare detected
+
+            logger.info("Detected Cloudflare challenge")
+
+            # Wait for challenge to process; a timeout here just means the
+            # page never went quiet, not that the challenge is still up
+            try:
+                await self.page.wait_for_load_state("networkidle", timeout=30000)
+            except PlaywrightTimeoutError:
+                logger.warning("Timed out waiting for Cloudflare challenge to clear")
+
+            # Recheck against the challenge texts only — markup markers can
+            # survive onto the real page and would give false negatives
+            content = await self._get_rendered_html()
+            return _CF_TEXTS_RE.search(content) is None
 
-            return True  # No Cloudflare detected
-            
         except Exception as e:
             logger.error(f"Error handling Cloudflare: {e}")
             return False
@@ -154,10 +258,11 @@ class PlaywrightScraper(BaseScraper):
         """
         retries = 0
         last_error = None
-        
+        host = urlparse(url).hostname
+
         while retries <= self.max_retries:
             try:
-                await self._ensure_browser()
+                await self._ensure_browser(host)
                 
                 # Navigate to page
                 await self.page.goto(url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
@@ -180,16 +285,23 @@ class PlaywrightScraper(BaseScraper):
                     logger.warning("Timeout waiting for page load - continuing anyway")
 
                 # Get page content
-                html_content = await self.page.content()
-                
-                # Parse with BeautifulSoup for content extraction
+                html_content = await self._get_rendered_html()
+
+                # Try to isolate the main content container in one evaluation
+                try:
+                    container_html = await self.page.evaluate(_CONTENT_SELECTOR_JS)
+                except Exception as e:
+                    logger.debug(f"Content selector evaluation failed: {e}")
+                    container_html = ""
+
+                # Parse with BeautifulSoup for title extraction
                 soup = BeautifulSoup(html_content, 'html.parser')
-                
+
                 # Get title
                 title = await self.extract_title(soup)
-                
+
                 # Clean and extract content
-                content = await clean_html_content(str(soup))
+                content = await clean_html_content(container_html or str(soup))
                 
                 if not content.strip():
                     return ScrapedContent(
@@ -200,6 +312,8 @@ class PlaywrightScraper(BaseScraper):
                         error="No content after cleaning"
                     )
 
+                await self._remember_storage_state(host)
+
                 return ScrapedContent(
                     url=url,
                     content=content,
@@ -218,6 +332,7 @@ class PlaywrightScraper(BaseScraper):
                         if self.page:
                             await self.page.close()
                             self.page = None
+                            self._cdp = None
                         continue
                 break
 
@@ -229,12 +344,25 @@ class PlaywrightScraper(BaseScraper):
             error=str(last_error)
         )
 
+    async def _remember_storage_state(self, host: Optional[str]) -> None:
+        """Snapshot the context's storage state for reuse on this host."""
+        if not host or not self.page:
+            return
+        try:
+            self._storage_states[host] = await self.page.context.storage_state()
+            self._storage_states.move_to_end(host)
+            while len(self._storage_states) > self._max_storage_states:
+                self._storage_states.popitem(last=False)
+        except Exception as e:
+            logger.debug(f"Could not snapshot storage state for {host}: {e}")
+
     async def cleanup(self) -> None:
         """Clean up Playwright resources."""
         try:
             if self.page:
                 await self.page.close()
                 self.page = None
+                self._cdp = None
             if self.browser:
                 await self.browser.close()
                 self.browser = None
@@ -244,4 +372,7 @@ class PlaywrightScraper(BaseScraper):
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
         finally:
-            gc.collect() 
\ No newline at end of file
+            # The browser process holds the real memory; a gen-0 sweep is
+            # enough to drop the Python-side protocol objects without
+            # walking the whole heap on every cleanup.
+            gc.collect(0) 
\ No newline at end of file
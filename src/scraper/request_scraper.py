@@ -10,10 +10,10 @@ from fake_useragent import UserAgent
 import time
 import asyncio
 
-from src.scraper.base import BaseScraper, ScrapedContent
+from src.scraper.base import BaseScraper, ScrapedContent, fast_title
 from src.content.cleaner import clean_html_content
 from src.utils.url import is_valid_url, is_likely_download_url
-from src.utils.constants import JS_REQUIRED_INDICATORS
+from src.utils.constants import js_required_scan
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +28,11 @@ class RequestScraper(BaseScraper):
         super().__init__()
         self.resource_cost = 1.0  # Lowest resource cost
         self.user_agent = UserAgent()
+        self._base_headers = {
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.5',
+            'DNT': '1',
+        }
         self.session = requests.Session()
         self.timeout = 10
         self.max_retries = 2
@@ -35,32 +40,11 @@ class RequestScraper(BaseScraper):
 
     async def is_suitable(self, url: str) -> bool:
         """Check if this scraper is suitable for the URL."""
-        if not await is_valid_url(url) or await is_likely_download_url(url):
-            return False
-            
-        # Try a HEAD request to check content type
-        try:
-            headers = {'User-Agent': self.user_agent.random}
-            response = self.session.head(
-                url, 
-                timeout=5, 
-                allow_redirects=True,
-                verify=False
-            )
-            
-            # Check content type
-            content_type = response.headers.get('content-type', '').lower()
-            if not 'text/html' in content_type:
-                return False
-                
-            # Check response code
-            if response.status_code != 200:
-                return False
-                
-            return True
-            
-        except:
+        # URL-shape checks only; the GET in scrape() filters non-HTML
+        # responses, so a HEAD preflight would just double connection cost.
+        if not is_valid_url(url) or is_likely_download_url(url):
             return False
+        return True
 
     async def scrape(self, url: str) -> ScrapedContent:
         """Scrape content using requests."""
@@ -69,13 +53,8 @@ class RequestScraper(BaseScraper):
         
         while retries <= self.max_retries:
             try:
-                headers = {
-                    'User-Agent': self.user_agent.random,
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.5',
-                    'DNT': '1',
-                }
-                
+                headers = dict(self._base_headers, **{'User-Agent': self._next_ua()})
+
                 response = self.session.get(
                     url, 
                     headers=headers,
@@ -83,15 +62,29 @@ class RequestScraper(BaseScraper):
                     verify=False  # Keep verify=False but suppress warnings
                 )
                 response.raise_for_status()
-                
+
+                # Filter non-HTML responses (previously done via HEAD preflight)
+                content_type = response.headers.get('content-type', '').lower()
+                if 'text/html' not in content_type:
+                    return ScrapedContent(
+                        url=url,
+                        content="",
+                        title="",
+                        status="error",
+                        error="Non-HTML content"
+                    )
+
                 html_content = response.text
                 
+                # Cheap regex title so rejected pages skip the full parse
+                title = fast_title(html_content)
+
                 # Quick check for very short content
                 if len(html_content.strip()) < 100:
                     return ScrapedContent(
                         url=url,
                         content="",
-                        title="",
+                        title=title,
                         status="error",
                         error="Page content too short"
                     )
@@ -105,13 +98,13 @@ class RequestScraper(BaseScraper):
                         return ScrapedContent(
                             url=url,
                             content="",
-                            title="",
+                            title=title,
                             status="error",
                             error="Page requires JavaScript"
                         )
 
-                    # Get title
-                    title = await self.extract_title(soup)
+                    # Get title, preferring the richer BS4 extraction
+                    title = await self.extract_title(soup) or title
                     
                     # Clean and extract content
                     content = await clean_html_content(str(soup))
@@ -138,7 +131,7 @@ class RequestScraper(BaseScraper):
                     return ScrapedContent(
                         url=url,
                         content="",
-                        title="",
+                        title=title,
                         status="error",
                         error=f"Content processing error: {str(e)}"
                     )
@@ -162,8 +155,7 @@ class RequestScraper(BaseScraper):
 
     def _requires_javascript(self, soup: BeautifulSoup) -> bool:
         """Check if page appears to require JavaScript."""
-        text = soup.get_text().lower()
-        return any(indicator in text for indicator in JS_REQUIRED_INDICATORS)
+        return js_required_scan(soup.get_text())
 
     async def cleanup(self) -> None:
         """Clean up resources."""
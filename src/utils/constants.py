@@ -2,10 +2,14 @@
 Shared constants used throughout the scraper application.
 """
 
-from typing import List, Set
+import os
+import re
+from typing import FrozenSet, List, Tuple
 
-# Browser configuration
-BROWSER_LAUNCH_ARGS: List[str] = [
+# Browser configuration. Immutable so no consumer can mutate the shared
+# launch arguments; the GPU fallback is decided once at import rather than
+# re-probing the filesystem on every browser spawn.
+BROWSER_LAUNCH_ARGS: Tuple[str, ...] = (
     '--disable-blink-features=AutomationControlled',
     '--disable-features=IsolateOrigins,site-per-process',
     '--disable-site-isolation-trials',
@@ -14,8 +18,10 @@ BROWSER_LAUNCH_ARGS: List[str] = [
     '--disable-setuid-sandbox',
     '--enable-gpu-rasterization',
     '--enable-gpu-compositing',
-    '--enable-gpu'
-]
+    '--enable-gpu',
+    # Software GL when no DRI render device is available
+    *(('--use-gl=swiftshader',) if not os.path.exists('/dev/dri') else ())
+)
 
 # Timeouts (in milliseconds)
 PAGE_LOAD_TIMEOUT: int = 60000      # 60 seconds for page load
@@ -24,7 +30,7 @@ DOM_CONTENT_TIMEOUT: int = 30000    # 30 seconds for DOM content
 SELECTOR_TIMEOUT: int = 10000       # 10 seconds for selectors
 
 # JavaScript detection patterns
-JS_REQUIRED_INDICATORS: Set[str] = {
+JS_REQUIRED_INDICATORS: FrozenSet[str] = frozenset({
     # Protection systems
     'captcha',
     'cloudflare',
@@ -88,13 +94,32 @@ JS_REQUIRED_INDICATORS: Set[str] = {
     'data-vue-app',
     'ng-app',
     'ember-app'
-}
+})
+
+# Single case-insensitive alternation over the indicators so consumers scan
+# the page text once instead of once per pattern.
+JS_REQUIRED_RE = re.compile(
+    '|'.join(re.escape(p) for p in sorted(JS_REQUIRED_INDICATORS)),
+    re.IGNORECASE
+)
+
+def js_required_scan(text: str) -> bool:
+    """
+    Check whether text contains any JS-required indicator.
+
+    Args:
+        text: Page text to scan
+
+    Returns:
+        bool: True if any indicator is present
+    """
+    return JS_REQUIRED_RE.search(text) is not None
 
 # API Configuration
 MAX_LOG_LENGTH: int = 10000  # Maximum length for log messages
 
 # File extensions to skip
-SKIP_EXTENSIONS: Set[str] = {
+SKIP_EXTENSIONS: FrozenSet[str] = frozenset({
     # Documents
     '.pdf', '.doc', '.docx', '.ppt', '.pptx', '.xls', '.xlsx',
     '.odt', '.ods', '.odp',
@@ -111,7 +136,7 @@ SKIP_EXTENSIONS: Set[str] = {
     '.rss',
     # Web formats
     '.css', '.js', '.woff', '.woff2', '.ttf', '.eot'
-}
+})
 
 # Download patterns to skip
 DOWNLOAD_PATTERNS: List[str] = [
@@ -126,4 +151,11 @@ DOWNLOAD_PATTERNS: List[str] = [
     '/attachments/',
     '/export/',
     '/print/'
-] 
\ No newline at end of file
+]
+
+# Case-insensitive alternation over the download patterns so URLs are
+# scanned once without a lowered copy.
+DOWNLOAD_PATTERNS_RE = re.compile(
+    '|'.join(re.escape(p) for p in DOWNLOAD_PATTERNS),
+    re.IGNORECASE
+) 
\ No newline at end of file
@@ -1,14 +1,26 @@
 """Health check endpoint for Docker."""
 
+import time
+
 from aiohttp import web
 import psutil
 
+# Memory reading cached briefly so frequent liveness probes don't each
+# re-read /proc/meminfo
+_CACHE_TTL = 1.0
+_last_check = 0.0
+_last_percent = 0.0
+
 async def health_handler(request):
     """Handle health check requests."""
+    global _last_check, _last_percent
     try:
-        # Check memory usage
-        memory = psutil.virtual_memory()
-        if memory.percent > 95:  # Critical memory threshold
+        # Check memory usage, refreshing the cached reading if stale
+        now = time.monotonic()
+        if now - _last_check > _CACHE_TTL:
+            _last_percent = psutil.virtual_memory().percent
+            _last_check = now
+        if _last_percent > 95:  # Critical memory threshold
             return web.Response(status=503, text="Memory usage critical")
             
         return web.Response(status=200, text="OK")
@@ -1,48 +1,108 @@
 """Link extraction and validation functionality."""
 
 import logging
-from typing import Set, List
-from urllib.parse import urljoin, urlparse
-from bs4 import BeautifulSoup
+import re
+from collections import OrderedDict
+from typing import List, Union
+from urllib.parse import urljoin, urlparse, urlsplit
+from bs4 import BeautifulSoup, SoupStrainer
 
-from .url import is_valid_url, is_likely_download_url
+from .url import is_valid_url, is_likely_download_url, canonicalize_url
 
 logger = logging.getLogger(__name__)
 
+# Prefer direct lxml parsing; fall back to BeautifulSoup with the stdlib
+# parser so the module still works without the optional dependency.
+try:
+    import lxml.html as _lxml_html
+    _BS4_PARSER = 'lxml'
+except ImportError:
+    _lxml_html = None
+    _BS4_PARSER = 'html.parser'
+
+# Only anchor tags with an href are ever inspected, so skip building tree
+# nodes for everything else.
+_ANCHOR_STRAINER = SoupStrainer('a', href=True)
+
+# Non-navigable href prefixes, matched in one C-level regex call per anchor
+_SKIP_PREFIX_RE = re.compile(r'^(javascript:|#|mailto:|tel:)', re.IGNORECASE)
+
+# Cap on remembered URLs per handler; oldest entries are evicted first so
+# long-running crawls don't grow the dedup set without bound
+_MAX_SEEN_LINKS = 100_000
+
 class LinkHandler:
     """Handles link extraction and validation."""
     
     def __init__(self, base_url: str):
         self.base_url = base_url
-        self.seen_links: Set[str] = set()
+        # Parse the base once; urljoin would otherwise re-split it per anchor
+        self._base_split = urlsplit(base_url)
+        self._base_origin = f"{self._base_split.scheme}://{self._base_split.netloc}"
+        # Insertion-ordered so eviction drops the oldest URLs first. Keys
+        # are 64-bit hashes of the canonical URL rather than the strings
+        # themselves, cutting per-entry memory by an order of magnitude;
+        # collision odds at this cardinality are negligible.
+        self.seen_links: "OrderedDict[int, None]" = OrderedDict()
 
-    async def process_links(self, html_content: str) -> List[str]:
+    def _iter_hrefs(self, html_content: Union[str, bytes]):
+        """
+        Yield raw href values from anchor tags.
+
+        Uses lxml's iterlinks directly when available, avoiding per-anchor
+        BS4 Tag object allocation; otherwise falls back to a strained
+        BeautifulSoup parse. Both parsers accept bytes natively, so callers
+        holding a raw response body can pass it without decoding first.
+        """
+        if _lxml_html is not None:
+            # lxml refuses str input that carries an XML encoding
+            # declaration (XHTML served as text/html); bytes input is
+            # always accepted, so re-encode rather than lose the page
+            if isinstance(html_content, str):
+                html_content = html_content.encode('utf-8')
+            root = _lxml_html.fromstring(html_content)
+            for element, attr, link, _ in root.iterlinks():
+                if attr == 'href' and element.tag == 'a':
+                    yield link
+            return
+
+        soup = BeautifulSoup(html_content, _BS4_PARSER, parse_only=_ANCHOR_STRAINER)
+        for a_tag in soup.find_all('a', href=True):
+            yield a_tag['href']
+
+    async def process_links(self, html_content: Union[str, bytes]) -> List[str]:
         """
         Extract all links from HTML content and validate them.
-        
+
         Args:
-            html_content: Raw HTML content
-            
+            html_content: Raw HTML content, as text or undecoded bytes
+
         Returns:
             List[str]: List of valid links
         """
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
             all_links = []
-            
+
             # Extract all links from anchor tags
-            for a_tag in soup.find_all('a', href=True):
-                href = a_tag['href'].strip()
-                
+            for href in self._iter_hrefs(html_content):
+                href = href.strip()
+
                 # Skip empty or non-HTTP links
-                if not href or href.startswith(('javascript:', '#', 'mailto:', 'tel:')):
+                if not href or _SKIP_PREFIX_RE.match(href):
                     continue
 
-                # Convert relative to absolute URLs
+                # Convert relative to absolute URLs. The common href shapes
+                # (already absolute, root-relative) resolve against the
+                # pre-parsed base without a urljoin re-split.
                 try:
-                    absolute_url = urljoin(self.base_url, href)
+                    if href.startswith(('http://', 'https://')):
+                        absolute_url = href
+                    elif href.startswith('/') and not href.startswith('//'):
+                        absolute_url = self._base_origin + href
+                    else:
+                        absolute_url = urljoin(self.base_url, href)
                 except Exception as e:
-                    logger.error(f"Error resolving URL {href}: {e}")
+                    logger.error("Error resolving URL %s: %s", href, e)
                     continue
 
                 # Basic URL validation
@@ -55,21 +115,25 @@ class LinkHandler:
                 except Exception:
                     continue
 
-                # Skip if already seen
-                if absolute_url in self.seen_links:
+                # Skip if already seen, comparing canonical forms so
+                # fragment/query-order/port variants collapse together
+                seen_key = hash(canonicalize_url(absolute_url))
+                if seen_key in self.seen_links:
                     continue
 
                 # Skip download URLs
-                if await is_likely_download_url(absolute_url):
+                if is_likely_download_url(absolute_url):
                     continue
 
-                # Add to collection
-                self.seen_links.add(absolute_url)
+                # Add to collection, evicting the oldest entry when full
+                self.seen_links[seen_key] = None
+                if len(self.seen_links) > _MAX_SEEN_LINKS:
+                    self.seen_links.popitem(last=False)
                 all_links.append(absolute_url)
 
-            logger.info(f"Extracted {len(all_links)} valid links")
+            logger.info("Extracted %d valid links", len(all_links))
             return all_links
 
         except Exception as e:
-            logger.error(f"Error extracting links: {e}", exc_info=True)
+            logger.error("Error extracting links: %s", e, exc_info=True)
             return [] 
\ No newline at end of file
@@ -2,12 +2,18 @@
 Logging configuration and utilities.
 """
 
+import atexit
 import logging
 import os
-from logging.handlers import RotatingFileHandler
+import queue
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 import sys
 from typing import Optional
 
+# Listener thread that drains log records to the real handlers; kept at
+# module scope so repeated setup_logging calls can stop the previous one
+_queue_listener: Optional[QueueListener] = None
+
 def setup_logging(
     debug: bool = False,
     log_dir: str = "log",
@@ -24,6 +30,8 @@ def setup_logging(
     Returns:
         logging.Logger: Configured logger
     """
+    global _queue_listener
+
     # Create logger
     logger = logging.getLogger('webscraper')
     logger.setLevel(logging.DEBUG if debug else logging.INFO)
@@ -53,13 +61,29 @@ def setup_logging(
     console_handler.setLevel(logging.DEBUG if debug else logging.INFO)
     console_handler.setFormatter(detailed_formatter)
     
-    # Add handlers to logger
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
-    
+    # Route records through a queue so file/console IO (and rotation)
+    # happens on a dedicated listener thread instead of the caller.
+    # Unregister before stopping: QueueListener.stop() is not idempotent,
+    # so a leftover atexit hook would raise at interpreter exit.
+    if _queue_listener is not None:
+        atexit.unregister(_queue_listener.stop)
+        _queue_listener.stop()
+
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+
+    _queue_listener = QueueListener(
+        log_queue,
+        file_handler,
+        console_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
+    atexit.register(_queue_listener.stop)
+
     # Prevent propagation to root logger
     logger.propagate = False
-    
+
     return logger
 
 def get_logger(name: str) -> logging.Logger:
@@ -30,8 +30,9 @@ class WorkerManager:
         self.max_temp = max_temp
         self.api_session = api_session
         self.institution_id = institution_id
-        self.workers = []
+        self.workers = set()
         self.stopped = False
+        self._worker_done: Optional[asyncio.Event] = None
 
     async def _check_resources(self) -> bool:
         """Check if system resources are within limits."""
@@ -71,10 +72,17 @@ class WorkerManager:
         except Exception as e:
             logger.error(f"Worker {worker_id} failed: {e}")
 
+    def _on_worker_done(self, task) -> None:
+        """Drop a finished worker task and wake the manage loop."""
+        self.workers.discard(task)
+        if self._worker_done is not None:
+            self._worker_done.set()
+
     async def run(self) -> None:
         """Run the worker manager."""
         logger.info(f"Starting {self.num_workers} workers")
-        
+        self._worker_done = asyncio.Event()
+
         try:
             while not self.stopped:
                 # Check system resources
@@ -86,12 +94,16 @@ class WorkerManager:
                 # Start workers up to num_workers
                 while len(self.workers) < self.num_workers:
                     worker = asyncio.create_task(self._start_worker())
-                    self.workers.append(worker)
+                    worker.add_done_callback(self._on_worker_done)
+                    self.workers.add(worker)
 
-                # Clean up finished workers
-                self.workers = [w for w in self.workers if not w.done()]
-                
-                await asyncio.sleep(10)
+                # Block until a worker finishes — so its replacement starts
+                # immediately — or the resource-check interval elapses
+                self._worker_done.clear()
+                try:
+                    await asyncio.wait_for(self._worker_done.wait(), timeout=60)
+                except asyncio.TimeoutError:
+                    pass
 
         except Exception as e:
             logger.error(f"Worker manager error: {e}")
@@ -101,10 +113,10 @@ class WorkerManager:
     async def shutdown(self) -> None:
         """Shutdown all workers."""
         self.stopped = True
-        for worker in self.workers:
+        for worker in list(self.workers):
             try:
                 worker.cancel()
                 await worker
             except:
                 pass
-        self.workers = [] 
\ No newline at end of file
+        self.workers = set() 
\ No newline at end of file
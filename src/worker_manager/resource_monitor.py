@@ -3,10 +3,14 @@ System resource monitoring functionality for the worker manager.
 """
 
 from dataclasses import dataclass
+import os
 import psutil
 import logging
+import time
 from typing import Optional
 
+_THERMAL_ZONE_PATH = '/sys/class/thermal/thermal_zone0/temp'
+
 logger = logging.getLogger(__name__)
 
 @dataclass
@@ -43,42 +47,73 @@ class ResourceMonitor:
         """
         self.max_memory_percent = max_memory_percent
         self.max_temp = max_temp
+        self._temp_fd: Optional[int] = None
         self.temp_monitoring_available = self._check_temp_monitoring()
+        # Memory readings cached briefly; /proc/meminfo doesn't need to be
+        # re-parsed on every monitor tick
+        self._memory_cache_ttl = 2.0
+        self._memory_cache_ts = 0.0
+        self._memory_cache = 0.0
 
     def _check_temp_monitoring(self) -> bool:
-        """Check if temperature monitoring is available on the system."""
+        """
+        Check if temperature monitoring is available on the system.
+
+        Keeps the thermal zone file descriptor open so later samples are a
+        single pread instead of a full open/read/close cycle.
+        """
         try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                float(f.read()) / 1000.0
-                return True
-        except:
+            fd = os.open(_THERMAL_ZONE_PATH, os.O_RDONLY)
+            try:
+                float(os.pread(fd, 16, 0)) / 1000.0
+            except Exception:
+                os.close(fd)
+                raise
+            self._temp_fd = fd
+            return True
+        except Exception:
             logger.warning("Temperature monitoring not available")
             return False
 
     def get_cpu_temperature(self) -> float:
         """
         Get current CPU temperature.
-        
+
         Returns:
             float: CPU temperature in Celsius or 0.0 if unavailable
         """
-        if not self.temp_monitoring_available:
+        if not self.temp_monitoring_available or self._temp_fd is None:
             return 0.0
         try:
-            with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                return float(f.read()) / 1000.0
+            return float(os.pread(self._temp_fd, 16, 0)) / 1000.0
         except Exception as e:
             logger.error(f"Error reading CPU temperature: {e}")
             return 0.0
 
+    def close(self) -> None:
+        """Release the kept-open thermal zone file descriptor."""
+        if self._temp_fd is not None:
+            try:
+                os.close(self._temp_fd)
+            except OSError:
+                pass
+            self._temp_fd = None
+
+    def __del__(self):
+        self.close()
+
     def get_memory_usage(self) -> float:
         """
         Get current system memory usage percentage.
         
         Returns:
-            float: Memory usage percentage
+            float: Memory usage percentage (cached for a couple of seconds)
         """
-        return psutil.virtual_memory().percent
+        now = time.monotonic()
+        if now - self._memory_cache_ts > self._memory_cache_ttl:
+            self._memory_cache = psutil.virtual_memory().percent
+            self._memory_cache_ts = now
+        return self._memory_cache
 
     async def check_resources(self) -> SystemResources:
         """
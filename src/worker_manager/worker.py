@@ -3,15 +3,40 @@ Worker class responsible for managing individual scraper processes.
 """
 
 import asyncio
-import subprocess
 import logging
+import os
+import signal
 import sys
+import time
+import weakref
 from typing import Optional
 from datetime import datetime
-import os
 
 logger = logging.getLogger(__name__)
 
+def _terminate_pid(pid: int) -> None:
+    """Best-effort SIGTERM for a leaked child; never blocks or raises."""
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except OSError:
+        pass
+
+# Cap concurrent fork+exec calls so boot/restart storms with many workers
+# don't flood the loop with SIGCHLD wakeups. Created lazily so the
+# semaphore binds to the running event loop.
+_SPAWN_LIMIT = 8
+_spawn_sem: Optional[asyncio.Semaphore] = None
+
+# With stderr merged into stdout, lines carrying these prefixes are
+# re-emitted at ERROR instead of the stream's base level
+_ERROR_LINE_PREFIXES = ('ERROR', 'CRITICAL', 'Traceback')
+
+def _get_spawn_sem() -> asyncio.Semaphore:
+    global _spawn_sem
+    if _spawn_sem is None:
+        _spawn_sem = asyncio.Semaphore(_SPAWN_LIMIT)
+    return _spawn_sem
+
 class Worker:
     """
     Manages an individual scraper process.
@@ -20,7 +45,7 @@ class Worker:
         worker_id (str): Unique identifier for the worker
         api_session (str): API session identifier
         institution_id (Optional[str]): Optional institution ID for filtering
-        process (Optional[subprocess.Popen]): Subprocess handle for the worker
+        process (Optional[asyncio.subprocess.Process]): Subprocess handle for the worker
         start_time (datetime): Time when the worker was started
         restart_interval (int): Time in seconds before worker should be restarted
     """
@@ -44,9 +69,23 @@ class Worker:
         self.worker_id = worker_id
         self.api_session = api_session
         self.institution_id = institution_id
-        self.process: Optional[subprocess.Popen] = None
+        self.process: Optional[asyncio.subprocess.Process] = None
         self.start_time = datetime.now()
         self.restart_interval = restart_interval
+        # Spawn command never changes for a worker's lifetime; build it
+        # once instead of per (re)start
+        self._command = (
+            sys.executable,
+            '-m',
+            'src.scraper.main',
+            '--session', api_session,
+            '--worker-id', worker_id
+        ) + (('--institution-id', institution_id) if institution_id else ())
+        self._exited: Optional[asyncio.Event] = None
+        self._exit_task: Optional[asyncio.Task] = None
+        self._monitor_task: Optional[asyncio.Task] = None
+        self._finalizer: Optional[weakref.finalize] = None
+        self._deadline = 0.0
 
     async def start(self) -> None:
         """
@@ -55,41 +94,79 @@ class Worker:
         Raises:
             RuntimeError: If worker is already running
         """
-        if self.process:
+        if self.process and self.process.returncode is None:
             raise RuntimeError(f"Worker {self.worker_id} is already running")
 
-        try:
-            # Build command with all necessary arguments
-            command = [
-                sys.executable,
-                '-m',
-                'src.scraper.main',
-                '--session', self.api_session,
-                '--worker-id', self.worker_id
-            ]
-
-            if self.institution_id:
-                command.extend(['--institution-id', self.institution_id])
+        # Starting over a dead handle bypasses stop(); disarm its finalizer
+        # here too, or GC would later SIGTERM the old — possibly recycled —
+        # pid
+        if self._finalizer is not None:
+            self._finalizer.detach()
+            self._finalizer = None
 
+        try:
             # Start process with pipe for output
-            self.process = subprocess.Popen(
-                command,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                universal_newlines=True,
-                env=os.environ.copy()  # Pass current environment
-            )
+            # env is left at its default so the child inherits the parent
+            # environment via the OS, without a Python-level dict copy.
+            # Keep preexec_fn/start_new_session/pass_fds absent: with the
+            # defaults CPython spawns via posix_spawn, avoiding a fork()
+            # page-table copy of this (potentially large) manager process.
+            # Adding any of them silently falls back to fork+exec.
+            async with _get_spawn_sem():
+                self.process = await asyncio.create_subprocess_exec(
+                    *self._command,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.STDOUT
+                )
             
             self.start_time = datetime.now()
-            logger.info(f"Started worker {self.worker_id}")
+            # Safety net for leaked workers: a non-blocking SIGTERM on GC,
+            # instead of __del__ (which would run blocking calls inside the
+            # collector and pin reference cycles)
+            self._finalizer = weakref.finalize(
+                self, _terminate_pid, self.process.pid
+            )
+            # Monotonic restart deadline: immune to wall-clock jumps and
+            # computed once instead of per liveness check
+            self._deadline = time.monotonic() + self.restart_interval
+            logger.info("Started worker %s", self.worker_id)
 
-            # Start output monitoring
-            asyncio.create_task(self._monitor_output())
+            # Reap the child in the background so liveness checks don't
+            # need to poll; the event flips exactly once, on exit
+            self._exited = asyncio.Event()
+            self._exit_task = asyncio.create_task(self._on_exit())
+
+            # Start output monitoring, keeping a reference so the task
+            # can't be garbage-collected mid-flight and a supervisor can
+            # gather it alongside its siblings
+            self._monitor_task = asyncio.create_task(
+                self._monitor_output(),
+                name=f"worker-{self.worker_id}-io"
+            )
 
         except Exception as e:
-            logger.error(f"Failed to start worker {self.worker_id}: {e}")
+            logger.error("Failed to start worker %s: %s", self.worker_id, e)
             raise
 
+    def tasks(self) -> list:
+        """
+        Return this worker's live background tasks.
+
+        Lets a supervisor gather monitoring and exit-watcher tasks for
+        all workers in a single asyncio.gather call.
+        """
+        return [t for t in (self._monitor_task, self._exit_task) if t is not None]
+
+    async def restart(self) -> None:
+        """
+        Cycle the worker process in place.
+
+        Lets a supervisor reuse the same Worker object across restart
+        intervals instead of constructing a fresh one per cycle.
+        """
+        await self.stop()
+        await self.start()
+
     async def stop(self) -> None:
         """
         Stop the worker process gracefully.
@@ -98,30 +175,35 @@ class Worker:
             return
 
         try:
-            # Try graceful shutdown first
-            self.process.terminate()
-            try:
-                await asyncio.wait_for(
-                    asyncio.create_task(self._wait_for_exit()),
-                    timeout=5.0
-                )
-            except asyncio.TimeoutError:
-                # Force kill if graceful shutdown fails
-                logger.warning(f"Worker {self.worker_id} did not stop gracefully, forcing kill")
-                self.process.kill()
-                await self._wait_for_exit()
+            # Try graceful shutdown first. Skip signalling when the child
+            # is already reaped — the routine stop-before-restart after a
+            # worker death — since terminate() on an exited asyncio
+            # process raises ProcessLookupError rather than no-op'ing.
+            if self.process.returncode is None:
+                self.process.terminate()
+                try:
+                    await asyncio.wait_for(self.process.wait(), timeout=5.0)
+                except asyncio.TimeoutError:
+                    # Force kill if graceful shutdown fails
+                    logger.warning("Worker %s did not stop gracefully, forcing kill", self.worker_id)
+                    self.process.kill()
+                    try:
+                        # Bounded: wait() resolves on pipe EOF, which a
+                        # surviving grandchild holding the inherited fd
+                        # can postpone past the SIGKILL
+                        await asyncio.wait_for(self.process.wait(), timeout=5.0)
+                    except asyncio.TimeoutError:
+                        if self.process.returncode is None:
+                            logger.error("Worker %s still running after kill", self.worker_id)
 
         except Exception as e:
-            logger.error(f"Error stopping worker {self.worker_id}: {e}")
+            logger.error("Error stopping worker %s: %s", self.worker_id, e)
         finally:
-            # Clean up process resources
-            if self.process:
-                try:
-                    self.process.stdout.close()
-                    self.process.stderr.close()
-                except:
-                    pass
-                self.process = None
+            # Process is reaped; don't let the finalizer signal a reused pid
+            if self._finalizer is not None:
+                self._finalizer.detach()
+                self._finalizer = None
+            self.process = None
 
     async def is_alive(self) -> bool:
         """
@@ -133,25 +215,29 @@ class Worker:
         if not self.process:
             return False
 
-        # Check if process is still running
-        if self.process.poll() is not None:
+        # Check if process is still running. returncode is set as soon as
+        # the child is reaped, whereas the exit watcher's wait() only
+        # resolves once the pipe hits EOF — which a surviving grandchild
+        # (e.g. an orphaned Chromium holding the inherited fd) can delay
+        # indefinitely.
+        if self.process.returncode is not None:
+            return False
+        if self._exited is None or self._exited.is_set():
             return False
 
         # Check if worker should be restarted due to age
-        age = (datetime.now() - self.start_time).total_seconds()
-        if age >= self.restart_interval:
-            logger.info(f"Worker {self.worker_id} reached restart interval")
+        if time.monotonic() >= self._deadline:
+            logger.info("Worker %s reached restart interval", self.worker_id)
             return False
 
         return True
 
-    async def _wait_for_exit(self) -> None:
-        """Wait for process to exit."""
+    async def _on_exit(self) -> None:
+        """Wait for the child to exit and flip the exited event."""
         if self.process:
-            await asyncio.get_event_loop().run_in_executor(
-                None, 
-                self.process.wait
-            )
+            await self.process.wait()
+        if self._exited is not None:
+            self._exited.set()
 
     async def _monitor_output(self) -> None:
         """
@@ -160,35 +246,39 @@ class Worker:
         if not self.process:
             return
 
-        async def read_stream(stream, level):
-            while True:
-                line = await asyncio.get_event_loop().run_in_executor(
-                    None, 
-                    stream.readline
-                )
-                if not line:
-                    break
-                line = line.strip()
-                if line:
-                    logger.log(level, f"Worker {self.worker_id}: {line}")
+        def emit(raw: str) -> None:
+            line = raw.strip()
+            if line:
+                level = (logging.ERROR if line.startswith(_ERROR_LINE_PREFIXES)
+                         else logging.INFO)
+                logger.log(level, "Worker %s: %s", self.worker_id, line)
 
         try:
-            # Monitor both stdout and stderr
-            await asyncio.gather(
-                read_stream(self.process.stdout, logging.INFO),
-                read_stream(self.process.stderr, logging.ERROR)
-            )
+            # stderr is merged into stdout at spawn, so one reader drains
+            # both streams: 64KB chunks, one await and one decode per chunk
+            stream = self.process.stdout
+            buf = ""
+            while True:
+                chunk = await stream.read(65536)
+                if not chunk:
+                    break
+                # Keep draining so the child never blocks on a full pipe,
+                # but skip all decode/split work when nothing at or above
+                # INFO would be emitted anyway
+                if not logger.isEnabledFor(logging.INFO):
+                    continue
+                buf += chunk.decode("utf-8", errors="replace")
+                *lines, buf = buf.split("\n")
+                for raw in lines:
+                    emit(raw)
+            # Flush any trailing partial line at EOF
+            emit(buf)
         except Exception as e:
-            logger.error(f"Error monitoring worker {self.worker_id} output: {e}")
+            logger.error("Error monitoring worker %s output: %s", self.worker_id, e)
 
-    def __del__(self):
-        """Ensure process is cleaned up on deletion."""
-        if self.process:
-            try:
-                self.process.terminate()
-                self.process.wait(timeout=1)
-            except:
-                try:
-                    self.process.kill()
-                except:
-                    pass 
\ No newline at end of file
+    async def __aenter__(self) -> "Worker":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.stop()
\ No newline at end of file